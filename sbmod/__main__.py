@@ -4,14 +4,6 @@ import argparse
 import logging
 import sys
 
-from sbmod.bot import Bot
-from sbmod.utilities import (
-    list_active_redditors,
-    list_redditors_with_admin_removed_items,
-    process_redditor,
-    process_redditors_from_list,
-)
-
 log = logging.getLogger(__package__)
 
 
@@ -36,6 +28,15 @@ def main() -> int:
 
     setup_logging(debug=arguments.debug)
 
+    # Deferred so that --help and argument errors don't pay for praw's import time.
+    from sbmod.bot import Bot  # noqa: PLC0415
+    from sbmod.utilities import (  # noqa: PLC0415
+        list_active_redditors,
+        list_redditors_with_admin_removed_items,
+        process_redditor,
+        process_redditors_from_list,
+    )
+
     bot = Bot()
 
     if arguments.active:
@@ -2,18 +2,30 @@
 
 import logging
 import pprint
+import re
 import time
 import traceback
 from typing import cast
 
 from praw import Reddit
-from praw.models import Message, Redditor
+from praw.models import Comment, Message, Redditor
 from prawcore.exceptions import PrawcoreException
-
-from sbmod.constants import EXCEPTION_SLEEP_TIME, EXCEPTION_USER, SUBREDDIT, USER_AGENT
+from sqlalchemy import delete
+
+from sbmod.constants import (
+    EXCEPTION_SLEEP_TIME,
+    EXCEPTION_USER,
+    INBOX_READ_BATCH_SIZE,
+    LISTING_CACHE_TTL,
+    QUEUED_TASK_CHECK_INTERVAL,
+    SUBREDDIT,
+    USER_AGENT,
+)
 from sbmod.models import AddContributorTask, Base, db_session
 from sbmod.utilities import add_contributor, process_redditor, seconds_to_next_hour
 
+USER_PREFIX_RE = re.compile(r"^/?u/", re.IGNORECASE)
+
 log = logging.getLogger(__package__)
 
 
@@ -23,19 +35,29 @@ class Bot:
     @property
     def contributors(self) -> list[Redditor]:
         """Return list of Redditors who are approved."""
-        return list(self.subreddit.contributor(limit=None))
+        if time.monotonic() >= self._contributors_expiry:
+            self._contributors = list(self.subreddit.contributor(limit=None))
+            self._contributors_expiry = time.monotonic() + LISTING_CACHE_TTL
+        return self._contributors
 
     @property
-    def moderators(self) -> list[Redditor]:
-        """Return list of Redditors who are moderators."""
-        if self._moderators is None:
-            self._moderators = list(self.subreddit.moderator(limit=None))
-        return self._moderators
+    def moderator_names(self) -> frozenset[str]:
+        """Return the lowercased names of Redditors who are moderators."""
+        if time.monotonic() >= self._moderators_expiry:
+            self._moderator_names = frozenset(
+                moderator.name.lower() for moderator in self.subreddit.moderator(limit=None)
+            )
+            self._moderators_expiry = time.monotonic() + LISTING_CACHE_TTL
+        return self._moderator_names
 
     def __init__(self) -> None:
         """Initialize variables needed throughout the various Bot actions."""
-        self._moderators = None
+        self._contributors: list[Redditor] = []
+        self._contributors_expiry = 0.0
+        self._moderator_names: frozenset[str] = frozenset()
+        self._moderators_expiry = 0.0
         self._running = True
+        self._next_task_check = 0.0
         self._next_task_times: dict[str, float] = {"AddContributorTask": 0}
         self.reddit = Reddit("sbmod", user_agent=USER_AGENT)
         self._exception_user = self.reddit.redditor(EXCEPTION_USER)
@@ -44,68 +66,84 @@ class Bot:
         with db_session() as session:
             Base.metadata.create_all(session.get_bind())
 
+    def _mark_read(self, items: list[Comment | Message]) -> None:
+        """Acknowledge processed inbox items in a single batched request."""
+        if items:
+            self.reddit.inbox.mark_read(items)
+            items.clear()
+
     def _run_loop(self) -> None:
         """Loop through actions, either queued, or user-input."""
         log.info("Waiting for inbox messages")
 
-        for item in self.reddit.inbox.stream(pause_after=4):
-            if item is None:
-                self.handle_queued_tasks(limit=20)
-                continue
-
-            if item.was_comment:  # ignore comments
-                item.mark_read()
-                continue
-
-            try:
-                self.handle_message(message=cast(Message, item))
-            except Exception:
-                item_info = pprint.pformat(vars(item), indent=4)
-                log.exception("Exception processing the following item:\n%s", item_info)
-
-                message = f"Exception\n{traceback.format_exc()}\nItem:\n{item_info}".replace("\n", "\n\n")
-                self._exception_user.message(message=message, subject=f"{USER_AGENT} exception")
-                time.sleep(EXCEPTION_SLEEP_TIME)  # Let's slow things down if there are issues
-                continue
-            item.mark_read()
+        pending_read: list[Comment | Message] = []
+        try:
+            for item in self.reddit.inbox.stream(pause_after=4):
+                if item is None:
+                    self._mark_read(pending_read)
+                    if time.monotonic() >= self._next_task_check:
+                        self.handle_queued_tasks(limit=20)
+                        self._next_task_check = time.monotonic() + QUEUED_TASK_CHECK_INTERVAL
+                    continue
+
+                if item.was_comment:  # ignore comments
+                    pending_read.append(item)
+                    continue
+
+                try:
+                    self.handle_message(message=cast(Message, item))
+                except Exception:
+                    item_info = pprint.pformat(vars(item), indent=4)
+                    log.exception("Exception processing the following item:\n%s", item_info)
+
+                    parts = ["Exception", *traceback.format_exc().splitlines(), "Item:", *item_info.splitlines()]
+                    message = "\n\n".join(parts)
+                    self._exception_user.message(message=message, subject=f"{USER_AGENT} exception")
+                    time.sleep(EXCEPTION_SLEEP_TIME)  # Let's slow things down if there are issues
+                    continue
+                pending_read.append(item)
+                if len(pending_read) >= INBOX_READ_BATCH_SIZE:
+                    self._mark_read(pending_read)
+        finally:
+            self._mark_read(pending_read)
 
     def handle_message(self, *, message: Message) -> None:
         """Process a single inbox message."""
-        if message.author not in self.moderators:
+        if message.author is None or message.author.name.lower() not in self.moderator_names:
             log.info("ignoring message from non-moderator user %s", message.author)
             return
 
         subject = message.subject.strip()
         if subject != "verify":
-            log.info("invalid subject %r from %s", subject, message.author)
+            log.info("invalid subject %r from %s", subject, message.author.name)
             message.reply(f"`{subject}` is not a valid command. Try `verify`.")
             return
 
         body = message.body.strip()
         if len(body.split()) != 1:
-            log.info("invalid body %r from %s", body, message.author)
+            log.info("invalid body %r from %s", body, message.author.name)
             message.reply("Message body must contain only a username")
             return
 
-        for prefix in ("u/", "/u/"):
-            if body.lower().startswith(prefix):
-                body = body[len(prefix) :]
+        body = USER_PREFIX_RE.sub("", body, count=1)
 
         log.info("processing %s ...", body)
         message.reply(f"processing {body} ...")
-        process_redditor(redditor=self.reddit.redditor(body), subreddit=self.subreddit)
+        process_redditor(redditor=self.reddit.redditor(body), subreddit=self.subreddit, use_cache=False)
 
     def handle_queued_tasks(self, *, limit: int = 4) -> None:
         """Run up to limit queued tasks they exist."""
         if self._next_task_times["AddContributorTask"] > time.monotonic():
             return
 
-        for _ in range(limit):
-            with db_session() as session:
-                if (task := AddContributorTask.next_task(session=session)) is None:
-                    log.debug("There are no queued tasks.")
-                    return
+        with db_session() as session:
+            tasks = AddContributorTask.next_tasks(limit=limit, session=session)
+            if not tasks:
+                log.debug("There are no queued tasks.")
+                return
 
+            successes = []
+            for task in tasks:
                 log.info("Attempting to add %s from saved task", task.username)
                 if add_contributor(
                     redditor=self.reddit.redditor(task.username),
@@ -113,11 +151,13 @@ class Bot:
                     save_to_db_on_failure=False,
                     subreddit=self.subreddit,
                 ):
-                    session.delete(task)
+                    successes.append(task.username)
                 else:
                     self._next_task_times["AddContributorTask"] = time.monotonic() + (seconds := seconds_to_next_hour())
                     log.info("Next add contributor attempt in %d seconds", seconds)
                     break
+            if successes:
+                session.execute(delete(AddContributorTask).where(AddContributorTask.username.in_(successes)))
 
     def run(self) -> None:
         """Provide the primary bot loop."""
@@ -8,8 +8,16 @@ BOT = "sbmodbot"
 EXCEPTION_SLEEP_TIME = 60
 EXCEPTION_USER = "bboe"
 FAILED_VERIFICATION_CONVERSATION_ID = "2i4snm"
+INBOX_READ_BATCH_SIZE = 25
+LISTING_CACHE_TTL = 600
+MODMAIL_FALLBACK_LIMIT = 50
+MODMAIL_RECENT_LIMIT = 10
+QUEUED_TASK_CHECK_INTERVAL = 60
 SUBREDDIT = "santabarbara"
 SUBREDDITS_TO_SHOW = 10
 TIMEZONE = ZoneInfo("America/Los_Angeles")
+VERIFICATION_FAILURE_TTL = 24 * 60 * 60
+VERIFICATION_SUCCESS_TTL = 7 * 24 * 60 * 60
+VERIFICATION_WORKERS = 8
 VERSION = "0.1.0"
 USER_AGENT = "SBModTool by u/bboe v0.1.0"
@@ -3,13 +3,14 @@
 import datetime
 from collections.abc import Iterator
 from contextlib import contextmanager
+from functools import lru_cache
 from typing import Annotated, Self
 
-from sqlalchemy import TIMESTAMP, create_engine
+from sqlalchemy import TIMESTAMP, Engine, create_engine, select
 from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
 from sqlalchemy.sql import func
 
-from sbmod.constants import DB_PATH
+from sbmod.constants import DB_PATH, VERIFICATION_FAILURE_TTL, VERIFICATION_SUCCESS_TTL
 
 timestamp = Annotated[
     datetime.datetime, mapped_column(TIMESTAMP(timezone=True), nullable=False, server_default=func.CURRENT_TIMESTAMP())
@@ -24,20 +25,54 @@ class AddContributorTask(Base):
     """Represent work that should be done."""
 
     __tablename__ = "add_contributor_tasks"
-    created_at: Mapped[timestamp]
+    created_at: Mapped[timestamp] = mapped_column(index=True)
     report: Mapped[str]
     username: Mapped[str] = mapped_column(primary_key=True)
 
     @classmethod
     def next_task(cls, *, session: Session) -> Self | None:
-        """Return a single task if one exists."""
-        return session.query(cls).first()
+        """Return the oldest task if one exists."""
+        return session.scalars(select(cls).order_by(cls.created_at, cls.username).limit(1)).first()
+
+    @classmethod
+    def next_tasks(cls, *, limit: int, session: Session) -> list[Self]:
+        """Return up to limit tasks, oldest first."""
+        return list(session.scalars(select(cls).order_by(cls.created_at, cls.username).limit(limit)))
+
+
+class VerificationResult(Base):
+    """Cache the most recent verification outcome for a redditor."""
+
+    __tablename__ = "verification_results"
+    checked_at: Mapped[timestamp]
+    report: Mapped[str]
+    username: Mapped[str] = mapped_column(primary_key=True)
+    verified: Mapped[bool]
+
+    @classmethod
+    def fresh(cls, *, session: Session, username: str) -> Self | None:
+        """Return the cached result for username if it is within its TTL."""
+        result = session.get(cls, username.lower())
+        if result is None:
+            return None
+        ttl = VERIFICATION_SUCCESS_TTL if result.verified else VERIFICATION_FAILURE_TTL
+        now = datetime.datetime.now(datetime.UTC).replace(tzinfo=None)
+        if result.checked_at < now - datetime.timedelta(seconds=ttl):
+            return None
+        return result
+
+
+@lru_cache
+def _engine(engine_url: str) -> Engine:
+    """Return a shared engine, and its connection pool, for engine_url."""
+    return create_engine(engine_url)
 
 
 @contextmanager
 def db_session(engine_url: str = f"sqlite:///{DB_PATH}") -> Iterator[Session]:
     """Provide access to the sqlite database."""
-    engine = create_engine(engine_url)
+    # In-memory databases are connection scoped, so sharing an engine would leak state between sessions.
+    engine = create_engine(engine_url) if ":memory:" in engine_url else _engine(engine_url)
     session = Session(engine, autobegin=False)
     try:
         session.begin()
@@ -2,26 +2,45 @@
 
 import json
 import logging
-import math
+import random
+import time
 from collections import Counter
-from datetime import UTC, datetime, timedelta
-from typing import TextIO
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+from typing import Any, TextIO
 
 from praw import Reddit
 from praw.exceptions import RedditAPIException
-from praw.models import Redditor, Subreddit
-
-from sbmod.constants import BOT, FAILED_VERIFICATION_CONVERSATION_ID
-from sbmod.models import AddContributorTask, db_session
+from praw.models import ModmailConversation, Redditor, Subreddit
+
+from sbmod.constants import (
+    BOT,
+    FAILED_VERIFICATION_CONVERSATION_ID,
+    MODMAIL_FALLBACK_LIMIT,
+    MODMAIL_RECENT_LIMIT,
+    VERIFICATION_WORKERS,
+)
+from sbmod.models import AddContributorTask, VerificationResult, db_session
 from sbmod.verification import Verification
 
 log = logging.getLogger(__package__)
 
 
 def add_contributor(
-    *, redditor: Redditor, report: str, save_to_db_on_failure: bool = True, subreddit: Subreddit
+    *,
+    conversations: dict[str, ModmailConversation] | None = None,
+    redditor: Redditor,
+    report: str,
+    save_to_db_on_failure: bool = True,
+    subreddit: Subreddit,
 ) -> bool:
-    """Add a contributor to the subreddit."""
+    """Add a contributor to the subreddit.
+
+    When ``conversations`` is provided it is used as a prefetched index of add contributor messages, avoiding a
+    modmail scan per redditor.
+
+    """
     try:
         subreddit.contributor.add(redditor)
     except RedditAPIException as exception:
@@ -31,83 +50,132 @@ def add_contributor(
                 return False
 
             with db_session() as session:
-                session.add(AddContributorTask(report=report, username=redditor.name))
+                session.merge(AddContributorTask(report=report, username=redditor.name))
             return False
         raise
-    for conversation in subreddit.modmail.conversations(state="all", limit=None):
-        if redditor in conversation.authors and BOT in conversation.authors and conversation.num_messages == 1:
+    if conversations is not None:
+        if (conversation := conversations.get(redditor.name.lower())) is not None:
             conversation.reply(body=report, internal=True)
-            break
-    else:
-        log.warning("Failed to locate add contributor message for %s:\n%s", redditor.name, report)
+        else:
+            log.warning("Failed to locate add contributor message for %s:\n%s", redditor.name, report)
+        return True
+    # Conversations are returned newest first and the target is almost always among the most recent, so scan a
+    # handful first and retry with a wider bound before giving up.
+    for limit in (MODMAIL_RECENT_LIMIT, MODMAIL_FALLBACK_LIMIT):
+        for conversation in subreddit.modmail.conversations(state="all", limit=limit):
+            if redditor in conversation.authors and BOT in conversation.authors and conversation.num_messages == 1:
+                conversation.reply(body=report, internal=True)
+                return True
+    log.warning("Failed to locate add contributor message for %s:\n%s", redditor.name, report)
     return True
 
 
+def fetch_bot_conversations(*, subreddit: Subreddit) -> dict[str, ModmailConversation]:
+    """Return a mapping from lowercased author name to their single-message conversation with the bot."""
+    bot_name = BOT.lower()
+    conversations: dict[str, ModmailConversation] = {}
+    for conversation in subreddit.modmail.conversations(state="all", limit=None):
+        if conversation.num_messages != 1:
+            continue
+        authors = {author.name.lower() for author in conversation.authors}
+        if bot_name not in authors:
+            continue
+        for author in authors - {bot_name}:
+            conversations.setdefault(author, conversation)
+    return conversations
+
+
 def list_active_redditors(*, subreddit: Subreddit) -> None:
-    """Output a list of the redditors who have commented in the most recent 1000 submissions."""
-    redditors = Counter()
-    log.info("fetching submissions")
-    submissions = list(subreddit.new(limit=None))  # pyright: ignore[reportArgumentType]
-    log.info("found %d submissions", len(submissions))
-    for submission in submissions:
-        submission.comments.replace_more(limit=0)
-        comments = submission.comments.list()
-        log.info("found %d comments", len(comments))
-        for comment in comments:
-            redditors[comment.author] += 1
+    """Output a list of the redditors who have made the most recent 1000 comments."""
+    log.info("fetching comments")
+    redditors = Counter(comment.author for comment in subreddit.comments(limit=1000))
+    log.info("found %d comments", redditors.total())
     print(redditors.most_common(None))
 
 
 def list_redditors_with_admin_removed_items(*, subreddit: Subreddit) -> None:
     """Output a list of redditors who have had submissions or comments removed by Reddit."""
-    redditors = Counter()
+
+    def removal_target_authors(entries: Iterator[Any], *, ignored: tuple[str, ...] = ()) -> Iterator[str]:
+        for entry in entries:
+            if entry.action in ignored:
+                continue
+            assert entry.action in ("removecomment", "removelink"), f"Unexpected entry action {entry.action}"
+            yield entry.target_author
 
     log.info("fetching anti-evil moderator log")
-    for entry in subreddit.mod.log(limit=None, mod="a"):
-        assert entry.action in ("removecomment", "removelink"), f"Unexpected entry action {entry.action}"
-        redditors[entry.target_author] += 100
+    admin_removals = Counter(removal_target_authors(subreddit.mod.log(limit=None, mod="a")))
 
     log.info("fetching reddit moderator log")
-    for entry in subreddit.mod.log(limit=None, mod="reddit"):
-        if entry.action in ("addmoderator", "marknsfw", "unmuteuser"):  # Ignored actions
-            continue
-        assert entry.action in ("removecomment", "removelink"), f"Unexpected entry action {entry.action}"
-        redditors[entry.target_author] += 1
+    redditors = Counter(
+        removal_target_authors(
+            subreddit.mod.log(limit=None, mod="reddit"), ignored=("addmoderator", "marknsfw", "unmuteuser")
+        )
+    )
+    redditors.update({redditor: 100 * count for redditor, count in admin_removals.items()})
 
     for redditor, count in sorted(redditors.items(), key=lambda x: (-x[1], x[0])):
         print(json.dumps({"count": count, "username": redditor}))
 
 
-def process_redditor(*, redditor: Redditor, subreddit: Subreddit) -> tuple[bool, str]:
-    """Run the verification for a single Redditor."""
+def process_redditor(
+    *,
+    conversations: dict[str, ModmailConversation] | None = None,
+    redditor: Redditor,
+    subreddit: Subreddit,
+    use_cache: bool = True,
+) -> tuple[bool, str]:
+    """Run the verification for a single Redditor, reusing a sufficiently recent saved result when available.
+
+    Pass ``use_cache=False`` to force a full verification; a cache hit performs no side effects, so interactive
+    callers that must deliver an outcome should bypass it.
+
+    """
+    if use_cache:
+        with db_session() as session:
+            if (cached := VerificationResult.fresh(session=session, username=redditor.name)) is not None:
+                log.info("using saved verification result for %s", redditor.name)
+                return cached.verified, cached.report
     verification = Verification(redditor=redditor, subreddit=subreddit)
     result = verification.verify()
     report = verification.report()
     if result:
-        add_contributor(redditor=redditor, report=report, subreddit=subreddit)
+        add_contributor(conversations=conversations, redditor=redditor, report=report, subreddit=subreddit)
     else:
         subreddit.modmail(FAILED_VERIFICATION_CONVERSATION_ID).reply(body=report)
+    with db_session() as session:
+        session.merge(
+            VerificationResult(
+                checked_at=datetime.now(tz=UTC).replace(tzinfo=None),
+                report=report,
+                username=redditor.name.lower(),
+                verified=result,
+            )
+        )
     return result, report
 
 
 def process_redditors_from_list(*, fp: TextIO, reddit: Reddit, subreddit: Subreddit) -> None:
     """Add all redditors from list provided via fp."""
-    contributors = set(subreddit.contributor(limit=None))
-    log.info("Found %d contributors", len(contributors))
-    for line in fp.readlines():
-        username = line.strip()
-        if not username:
-            continue
-        redditor = reddit.redditor(username)
-        if redditor in contributors:
-            log.info("Already a contributor: %s", redditor)
-            continue
+    contributor_names = frozenset(contributor.name.lower() for contributor in subreddit.contributor(limit=None))
+    log.info("Found %d contributors", len(contributor_names))
+
+    conversations = fetch_bot_conversations(subreddit=subreddit)
+    log.info("Found %d bot conversations", len(conversations))
 
-        process_redditor(redditor=redditor, subreddit=subreddit)
+    def process(username: str) -> None:
+        process_redditor(conversations=conversations, redditor=reddit.redditor(username), subreddit=subreddit)
+
+    usernames = []
+    for username in filter(None, (line.strip() for line in fp)):
+        if username.lower() in contributor_names:
+            log.info("Already a contributor: %s", username)
+            continue
+        usernames.append(username)
+    with ThreadPoolExecutor(max_workers=VERIFICATION_WORKERS) as executor:
+        list(executor.map(process, usernames))
 
 
 def seconds_to_next_hour() -> int:
-    """Return the number of seconds to the next hour."""
-    now = datetime.now(tz=UTC)
-    next_hour = (now + timedelta(hours=1)).replace(microsecond=0, minute=0, second=0)
-    return int(math.ceil((next_hour - now).total_seconds()))
+    """Return the number of seconds to the next hour, plus jitter to spread retries across instances."""
+    return 3600 - int(time.time()) % 3600 + random.randint(0, 59)  # noqa: S311
@@ -1,39 +1,99 @@
 """Provides the Verification class."""
 
 import logging
+import time
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
 from datetime import datetime, timedelta
+from functools import partial
+from typing import Any
 
-from praw.models import Comment, Redditor, Subreddit
-from prawcore.exceptions import NotFound
+from praw.models import ModNote, Redditor, Subreddit
+from prawcore.exceptions import NotFound, PrawcoreException
 
 from sbmod.constants import SUBREDDITS_TO_SHOW, TIMEZONE
 
 OLDEST_COMMENT_MARKER = timedelta(days=182)  # account's oldest subreddit comment must be at least 182 days old
+STATUS_CACHE_TTL = 300  # seconds status and mod note lookups may be reused across verifications
+SUFFICIENT_COMMENTS = 100  # stop fetching pages once this many subreddit comments clear the marker
 
 log = logging.getLogger(__package__)
 
+_executor = ThreadPoolExecutor(thread_name_prefix="verification")
+_note_cache: dict[str, tuple[float, list[ModNote]]] = {}
+_status_cache: dict[str, tuple[float, str | None]] = {}
 
-def _d(timestamp: float, /) -> datetime:
-    return datetime.fromtimestamp(timestamp, tz=TIMEZONE)
+# Pre-bound templates for the lines results() emits in loops.
+_NOTE_LINE = "    {:>14} count: {}".format
+_SUBREDDIT_LINE = "                          - {} ({} comments)".format
+
+
+_d = partial(datetime.fromtimestamp, tz=TIMEZONE)
+
+
+def _prune_expired(cache: dict[str, tuple[float, Any]]) -> None:
+    """Drop expired entries so long-running processes don't accumulate stale data."""
+    now = time.monotonic()
+    for name in [name for name, (expiry, _) in cache.items() if expiry <= now]:
+        del cache[name]
+
+
+def clear_caches() -> None:
+    """Empty the status and mod note caches shared across Verification instances."""
+    _note_cache.clear()
+    _status_cache.clear()
 
 
 class Verification:
     """Analyze and provide report on a redditor's activity history."""
 
-    def __init__(self, *, marker: datetime | None = None, redditor: Redditor, subreddit: Subreddit) -> None:
+    __slots__ = (
+        "_marker",
+        "_marker_ts",
+        "_newest",
+        "_oldest",
+        "_redditor",
+        "_report",
+        "_subreddit",
+        "_subreddit_name_lower",
+        "_sufficient_comments",
+        "_verified",
+        "comments",
+        "error",
+        "found_comments",
+        "karma",
+        "karma_average",
+        "note_types",
+        "subreddits",
+    )
+
+    def __init__(
+        self,
+        *,
+        marker: datetime | None = None,
+        redditor: Redditor,
+        subreddit: Subreddit,
+        sufficient_comments: int = SUFFICIENT_COMMENTS,
+    ) -> None:
         """Store information about this particular Verification."""
         self._marker = datetime.now(tz=TIMEZONE) - OLDEST_COMMENT_MARKER if marker is None else marker
+        self._marker_ts = self._marker.timestamp()
+        self._sufficient_comments = sufficient_comments
+        self._newest: tuple[float, int] | None = None
+        self._oldest: tuple[float, int] | None = None
         self._redditor = redditor
+        self._report: str | None = None
         self._subreddit = subreddit
+        self._subreddit_name_lower = str(subreddit).lower()
         self._verified: bool | None = None
-        self.comments: list[Comment] = []
+        self.comments: list[tuple[float, int]] = []  # (created_utc, score) for subreddit comments
         self.error: str | None = None
         self.found_comments = 0
         self.karma: int | None = None
         self.karma_average: float | None = None
-        self.note_types = Counter()
-        self.subreddits: Counter[Subreddit] = Counter()
+        self.note_types: dict[str, int] = {}
+        self.subreddits: Counter[str] = Counter()
 
     @property
     def created(self) -> datetime:
@@ -41,46 +101,84 @@ class Verification:
         return _d(self._redditor.created_utc)
 
     def _process_comments(self) -> bool:
-        """Fetch as many comments for the redditor and save some information."""
-        log.info("fetching comments for %s", self._redditor)
+        """Fetch as many comments for the redditor and save some information.
+
+        Comments arrive newest first, so once enough subreddit comments are collected and the oldest of them
+        predates the marker, additional pages cannot change the outcome and fetching stops early.
+
+        """
+        log.info("fetching comments for %s", self._redditor.name)
+        karma = 0
+        subreddit_names = []
         for comment in self._redditor.comments.new(limit=1000):
-            self.found_comments += 1
-            self.subreddits[comment.subreddit] += 1
-            if comment.subreddit != self._subreddit:
+            subreddit_name = str(comment.subreddit)
+            subreddit_names.append(subreddit_name)
+            # Compare the already-computed names directly rather than through Subreddit.__eq__.
+            if subreddit_name.lower() != self._subreddit_name_lower:
                 continue
-            self.comments.append(comment)
-        self.comments.sort(key=lambda x: x.created_utc)
+            score: int = comment.score
+            self.comments.append((comment.created_utc, score))
+            karma += score
+            if len(self.comments) >= self._sufficient_comments and comment.created_utc < self._marker_ts:
+                log.debug("stopping comment fetch early after %d comments", len(subreddit_names))
+                break
+        self.found_comments = len(subreddit_names)
+        self.subreddits.update(subreddit_names)
 
         if not self.comments:
             self.error = f"has no r/{self._subreddit} history."
             return False
 
-        oldest_comment_date = _d(self.comments[0].created_utc)
-        if oldest_comment_date > self._marker:
-            self.error = f"oldest r/{self._subreddit} comment is too recent ({oldest_comment_date})"
+        # Only the endpoints are ever reported, so find them in O(N) rather than sorting the whole list. Tuples
+        # compare by their first element, created_utc.
+        self._newest = max(self.comments)
+        self._oldest = min(self.comments)
+
+        if self._oldest[0] > self._marker_ts:
+            self.error = f"oldest r/{self._subreddit} comment is too recent ({_d(self._oldest[0])})"
             return False
 
-        self.karma = sum(comment.score for comment in self.comments)
-        self.karma_average = self.karma / len(self.comments)
+        self.karma = karma
+        self.karma_average = karma / len(self.comments)
 
         if self.karma_average < 1:
             self.error = "too low of karma average"
             return False
         return True
 
-    def _process_notes(self) -> bool:
+    def _fetch_notes(self) -> list[ModNote]:
+        """Return all mod notes for the redditor, reusing a recent lookup when available."""
+        name = self._redditor.name.lower()
+        if (cached := _note_cache.get(name)) is not None and cached[0] > time.monotonic():
+            return cached[1]
+        notes = list(self._subreddit.mod.notes.redditors(self._redditor, limit=None))
+        if all(note.type not in ("BAN", "MUTE") for note in notes):  # never mask a lifted ban or mute
+            _prune_expired(_note_cache)
+            _note_cache[name] = (time.monotonic() + STATUS_CACHE_TTL, notes)
+        return notes
+
+    def _process_notes(self, notes: list[ModNote]) -> bool:
         """Collect counts of mod notes. Return true if validation should continue."""
-        for note in self._subreddit.mod.notes.redditors(self._redditor, limit=None):
-            self.note_types[note.type] += 1
-        if (bans := self.note_types["BAN"]) > 0:
-            self.error = f"has {bans} ban(s). Skipped history collection."
+        for note in notes:
+            self.note_types[note.type] = self.note_types.get(note.type, 0) + 1
+        if (bans := self.note_types.get("BAN", 0)) > 0:
+            self.error = f"has {bans} ban(s)."
             return False
-        if (mutes := self.note_types["MUTE"]) > 0:
-            self.error = f"has {mutes} mute(s). Skipped history collection."
+        if (mutes := self.note_types.get("MUTE", 0)) > 0:
+            self.error = f"has {mutes} mute(s)."
             return False
         return True
 
     def _redditor_status(self) -> None:
+        name = self._redditor.name.lower()
+        if (cached := _status_cache.get(name)) is not None and cached[0] > time.monotonic():
+            self.error = cached[1]
+            return
+        self._fetch_redditor_status()
+        _prune_expired(_status_cache)
+        _status_cache[name] = (time.monotonic() + STATUS_CACHE_TTL, self.error)
+
+    def _fetch_redditor_status(self) -> None:
         try:
             self._redditor.is_blocked  # noqa: B018
         except NotFound:
@@ -91,7 +189,7 @@ class Verification:
             self.error = "is suspended. No history information available."
             return
 
-        if self.created > self._marker:
+        if self._redditor.created_utc > self._marker_ts:
             self.error = f"was created too recently ({self.created}). Skipped history collection."
             return
 
@@ -100,45 +198,56 @@ class Verification:
         if self._verified is None:
             message = "verify hasn't been called yet"
             raise TypeError(message)
-        if self._verified:
-            return self.results()
-        return f"u/{self._redditor.name}: verification fail\n\nAccount {self.error}"
+        if self._report is None:
+            if self._verified:
+                self._report = self.results()
+            else:
+                self._report = f"u/{self._redditor.name}: verification fail\n\nAccount {self.error}"
+        return self._report
 
     def results(self) -> str:
         """Return a reddit markdown report for the verification."""
         lines = []
-        lines.append(f"                User: {self._redditor.name}")
-        lines.append(f"             Created: {self.created}")
-        lines.append(f"Commented subreddits: {len(self.subreddits)}")
+        lines.append(f"                    User: {self._redditor.name}")
+        lines.append(f"                 Created: {self.created}")
+        lines.append(f"    Commented subreddits: {len(self.subreddits)}")
 
         if len(self.subreddits) > SUBREDDITS_TO_SHOW:
             top_subreddits = self.subreddits.most_common(SUBREDDITS_TO_SHOW)
-            lines.append(f"   Top {SUBREDDITS_TO_SHOW} subreddits:")
+            lines.append(f"       Top {SUBREDDITS_TO_SHOW} subreddits:")
         else:
             top_subreddits = self.subreddits.most_common(None)
         for subreddit, count in top_subreddits:
-            lines.append(f"                      - {subreddit} ({count} comments)")
+            lines.append(_SUBREDDIT_LINE(subreddit, count))
 
-        lines.append(f"Total comments found: {self.found_comments}")
+        lines.append(f"    Total comments found: {self.found_comments}")
         lines.append("")
-        lines.append(f"r/{self._subreddit} specific")
-        lines.append(f"            Comments: {len(self.comments)}")
+        lines.append(f"    r/{self._subreddit} specific")
+        lines.append(f"                Comments: {len(self.comments)}")
 
-        if self.comments:
-            lines.append(f"       Comment karma: {self.karma}")
-            lines.append(f"       Average karma: {self.karma_average:.02f}")
-            lines.append(f"      Newest comment: {_d(self.comments[-1].created_utc)}")
-            lines.append(f"      Oldest comment: {_d(self.comments[0].created_utc)}")
+        if self._newest is not None and self._oldest is not None:
+            lines.append(f"           Comment karma: {self.karma}")
+            lines.append(f"           Average karma: {self.karma_average:.02f}")
+            lines.append(f"          Newest comment: {_d(self._newest[0])}")
+            lines.append(f"          Oldest comment: {_d(self._oldest[0])}")
 
         for note_type, count in sorted(self.note_types.items()):
-            lines.append(f"{note_type:>14} count: {count}")
-        return "\n".join(f"    {line}" if line else "" for line in lines)
+            lines.append(_NOTE_LINE(note_type, count))
+        return "\n".join(lines)
 
     def verify(self) -> bool:
         """Validate the redditor."""
+        notes_future = _executor.submit(self._fetch_notes)
         self._redditor_status()
-        if self.error is not None or not self._process_notes():
+        if self.error is not None:
+            with suppress(PrawcoreException):  # notes for an invalid account are of no use
+                notes_future.result()
             self._verified = False
-        else:
-            self._verified = self._process_comments()
+            return self._verified
+        verified = self._process_comments()
+        # Evaluate notes last so their fetch overlaps with the comment listing; a ban or mute overrides any
+        # comment-based outcome.
+        if not self._process_notes(notes_future.result()):
+            verified = False
+        self._verified = verified
         return self._verified
@@ -1,7 +1,9 @@
+from datetime import UTC, datetime, timedelta
+
 import pytest
 import sqlalchemy
 
-from sbmod.models import AddContributorTask, Base, db_session
+from sbmod.models import AddContributorTask, Base, VerificationResult, db_session
 
 
 def test_add_contributor_task__duplicate_username() -> None:
@@ -22,7 +24,58 @@ def test_add_contributor_task__next_task() -> None:
         assert AddContributorTask.next_task(session=session) == task
 
 
+def test_add_contributor_task__next_tasks() -> None:
+    with db_session(engine_url="sqlite:///:memory:") as session:
+        Base.metadata.create_all(session.get_bind())
+        assert AddContributorTask.next_tasks(limit=2, session=session) == []
+
+        session.add(task1 := AddContributorTask(report="Some report", username="user1"))
+        session.add(task2 := AddContributorTask(report="Some report", username="user2"))
+        session.flush()
+
+        assert AddContributorTask.next_tasks(limit=1, session=session) == [task1]
+        assert AddContributorTask.next_tasks(limit=4, session=session) == [task1, task2]
+
+
 def test_add_contributor_task__next_task__empty_table() -> None:
     with db_session(engine_url="sqlite:///:memory:") as session:
         Base.metadata.create_all(session.get_bind())
         assert AddContributorTask.next_task(session=session) is None
+
+
+def test_verification_result__fresh() -> None:
+    now = datetime.now(tz=UTC).replace(tzinfo=None)
+    with db_session(engine_url="sqlite:///:memory:") as session:
+        Base.metadata.create_all(session.get_bind())
+        session.add(result := VerificationResult(checked_at=now, report="Some report", username="user1", verified=True))
+        session.flush()
+
+        assert VerificationResult.fresh(session=session, username="user1") == result
+        assert VerificationResult.fresh(session=session, username="USER1") == result
+        assert VerificationResult.fresh(session=session, username="user2") is None
+
+
+def test_verification_result__fresh__expired() -> None:
+    now = datetime.now(tz=UTC).replace(tzinfo=None)
+    with db_session(engine_url="sqlite:///:memory:") as session:
+        Base.metadata.create_all(session.get_bind())
+        session.add(
+            VerificationResult(
+                checked_at=now - timedelta(days=8), report="Some report", username="user1", verified=True
+            )
+        )
+        session.add(
+            VerificationResult(
+                checked_at=now - timedelta(days=2), report="Some report", username="user2", verified=False
+            )
+        )
+        session.add(
+            result := VerificationResult(
+                checked_at=now - timedelta(hours=2), report="Some report", username="user3", verified=False
+            )
+        )
+        session.flush()
+
+        assert VerificationResult.fresh(session=session, username="user1") is None
+        assert VerificationResult.fresh(session=session, username="user2") is None
+        assert VerificationResult.fresh(session=session, username="user3") == result
@@ -1,14 +1,20 @@
 from datetime import datetime, timedelta
 from unittest.mock import MagicMock, Mock, PropertyMock
 
+import pytest
 from prawcore.exceptions import NotFound
 
 from sbmod.constants import SUBREDDIT, TIMEZONE
-from sbmod.verification import OLDEST_COMMENT_MARKER, Verification, _d
+from sbmod.verification import OLDEST_COMMENT_MARKER, Verification, _d, clear_caches
 
 MARKER = datetime.now(tz=TIMEZONE) - OLDEST_COMMENT_MARKER
 
 
+@pytest.fixture(autouse=True)
+def _isolate_verification_caches() -> None:
+    clear_caches()
+
+
 def create_mock_comment(*, created: float = 1700000000, score: int = 1, subreddit: Mock) -> Mock:
     """Return an object like praw.models.Comment."""
     comment = Mock()
@@ -90,7 +96,7 @@ def test_verification__has_ban() -> None:
     mock_subreddit = create_mock_subreddit(notes=[create_mock_note()])
     verification = Verification(marker=MARKER, redditor=mock_redditor, subreddit=mock_subreddit)
     assert not verification.verify()
-    assert verification.report() == "u/hasban: verification fail\n\nAccount has 1 ban(s). Skipped history collection."
+    assert verification.report() == "u/hasban: verification fail\n\nAccount has 1 ban(s)."
 
 
 def test_verification__has_bans() -> None:
@@ -98,7 +104,7 @@ def test_verification__has_bans() -> None:
     mock_subreddit = create_mock_subreddit(notes=[create_mock_note(), create_mock_note()])
     verification = Verification(marker=MARKER, redditor=mock_redditor, subreddit=mock_subreddit)
     assert not verification.verify()
-    assert verification.report() == "u/hasbans: verification fail\n\nAccount has 2 ban(s). Skipped history collection."
+    assert verification.report() == "u/hasbans: verification fail\n\nAccount has 2 ban(s)."
 
 
 def test_verification__has_mutes() -> None:
@@ -106,9 +112,7 @@ def test_verification__has_mutes() -> None:
     mock_subreddit = create_mock_subreddit(notes=[create_mock_note(type_="MUTE"), create_mock_note(type_="MUTE")])
     verification = Verification(marker=MARKER, redditor=mock_redditor, subreddit=mock_subreddit)
     assert not verification.verify()
-    assert (
-        verification.report() == "u/hasmutes: verification fail\n\nAccount has 2 mute(s). Skipped history collection."
-    )
+    assert verification.report() == "u/hasmutes: verification fail\n\nAccount has 2 mute(s)."
 
 
 def test_verification__has_no_history() -> None:
@@ -142,6 +146,20 @@ def test_verification__oldest_comment_too_recent() -> None:
     )
 
 
+def test_verification__stops_fetching_early() -> None:
+    mock_subreddit = create_mock_subreddit()
+    mock_redditor = create_mock_redditor(
+        comments=[
+            create_mock_comment(created=MARKER.timestamp() - 1, subreddit=mock_subreddit),
+            create_mock_comment(created=MARKER.timestamp() - 2, subreddit=mock_subreddit),
+            create_mock_comment(created=MARKER.timestamp() - 3, subreddit=mock_subreddit),
+        ]
+    )
+    verification = Verification(marker=MARKER, redditor=mock_redditor, subreddit=mock_subreddit, sufficient_comments=2)
+    assert verification.verify()
+    assert verification.found_comments == 2
+
+
 def test_verification__pass_with_many_subreddits() -> None:
     mock_subreddit = create_mock_subreddit()
     mock_redditor = create_mock_redditor(
@@ -1,5 +1,4 @@
 import logging
-from datetime import UTC, datetime
 from unittest.mock import Mock, patch
 
 import pytest
@@ -17,6 +16,17 @@ def test_add_contributor__no_conversation(caplog: pytest.LogCaptureFixture) -> N
     assert caplog.records[0].message == "Failed to locate add contributor message for redditor:\nsome report"
 
 
+def test_add_contributor__prefetched_conversations() -> None:
+    mock_conversation = Mock()
+    mock_subreddit = Mock()
+    redditor = create_mock_redditor()
+    assert add_contributor(
+        conversations={"redditor": mock_conversation}, redditor=redditor, report="some report", subreddit=mock_subreddit
+    )
+    mock_conversation.reply.assert_called_once_with(body="some report", internal=True)
+    mock_subreddit.modmail.conversations.assert_not_called()
+
+
 def test_add_contributor__replies_once() -> None:
     mock_conversation = Mock(authors=[redditor := create_mock_redditor(), BOT], num_messages=1)
     mock_subreddit = Mock()
@@ -26,19 +36,25 @@ def test_add_contributor__replies_once() -> None:
 
 
 def test_seconds_to_next_hour() -> None:
-    assert 0 < seconds_to_next_hour() <= 3600
-
-    with patch("sbmod.utilities.datetime", now=(now_mock := Mock())):
-        now_mock.return_value = datetime(day=1, month=1, tzinfo=UTC, year=2025)
+    assert 0 < seconds_to_next_hour() <= 3660
+
+    top_of_hour = 1735689600  # 2025-01-01 00:00:00 UTC
+    with (
+        patch("sbmod.utilities.random", randint=(randint_mock := Mock(return_value=0))),
+        patch("sbmod.utilities.time", time=(time_mock := Mock())),
+    ):
+        time_mock.return_value = top_of_hour
         assert seconds_to_next_hour() == 3600
 
-        now_mock.return_value = datetime(day=1, minute=59, month=1, tzinfo=UTC, year=2025)
+        time_mock.return_value = top_of_hour + 3540
         assert seconds_to_next_hour() == 60
 
-        now_mock.return_value = datetime(day=1, minute=59, month=1, second=59, tzinfo=UTC, year=2025)
+        time_mock.return_value = top_of_hour + 3599
         assert seconds_to_next_hour() == 1
 
-        now_mock.return_value = datetime(
-            day=1, microsecond=999999, minute=59, month=1, second=59, tzinfo=UTC, year=2025
-        )
+        time_mock.return_value = top_of_hour + 3599.999999
         assert seconds_to_next_hour() == 1
+
+        randint_mock.return_value = 59
+        time_mock.return_value = top_of_hour + 3599
+        assert seconds_to_next_hour() == 60